@@ -1,7 +1,7 @@
 """Definitions of specialized agents for the Task Orchestrating Agent system.
 
 Each agent encapsulates a specific domain expertise and uses the OpenAI
-ChatCompletion API to fulfil its assigned subtask. Agents derive from
+Chat Completions API to fulfil its assigned subtask. Agents derive from
 ``BaseAgent``, which manages API calls and error handling. The three
 concrete agents shipped with this package are:
 
@@ -18,13 +18,13 @@ and overriding the ``role_prompt`` attribute.
 
 from __future__ import annotations
 
-import os
-from typing import Optional
+import functools
+import io
+from typing import Callable, Iterator, Optional
 
-try:
-    import openai  # type: ignore
-except ImportError:  # pragma: no cover
-    openai = None
+from .cache import LLMCache
+from .client import _get_async_client, _get_client
+from .ratelimit import RateLimiter, throttle
 
 
 class BaseAgent:
@@ -32,35 +32,56 @@ class BaseAgent:
 
     Subclasses should provide a ``role_prompt`` attribute that defines the
     system message used to instruct the language model about the agent's role.
+    An optional :class:`~task_orchestrating_agent.cache.LLMCache` lets
+    repeated deterministic subtasks be answered without calling the API.
     """
 
     name: str = "base"
     role_prompt: str = ""
     model: str = "gpt-4"
 
-    def __init__(self, *, name: Optional[str] = None, role_prompt: Optional[str] = None, model: Optional[str] = None) -> None:
+    def __init__(
+        self,
+        *,
+        name: Optional[str] = None,
+        role_prompt: Optional[str] = None,
+        model: Optional[str] = None,
+        cache: Optional[LLMCache] = None,
+    ) -> None:
         if name is not None:
             self.name = name
         if role_prompt is not None:
             self.role_prompt = role_prompt
         if model is not None:
             self.model = model
+        self.cache = cache
+        # The system turn never changes, so it is built once and shared by all requests.
+        self._system_msg = {"role": "system", "content": self.role_prompt}
 
-    def _ensure_openai(self, api_key: Optional[str]) -> None:
-        """Ensure the OpenAI package is installed and the API key is set."""
-        if openai is None:
-            raise RuntimeError(
-                "The openai package is not installed. Install it with `pip install openai`."
-            )
-        key = api_key or os.getenv("OPENAI_API_KEY")
-        if not key:
+    @functools.cached_property
+    def short_description(self) -> str:
+        """First sentence of the role prompt, used to describe the agent to the planner."""
+        return self.role_prompt.split(".", 1)[0] + "..."
+
+    def messages(self, task: str) -> list[dict]:
+        """Build the chat messages sent to the model for ``task``."""
+        return [self._system_msg, {"role": "user", "content": task}]
+
+    def _delta(self, chunk) -> str:
+        """Return the text carried by one streamed chat completion chunk."""
+        try:
+            return (chunk.choices[0].delta.content or "") if chunk.choices else ""
+        except Exception as exc:
             raise RuntimeError(
-                "No OpenAI API key provided. Set the OPENAI_API_KEY environment variable or pass the api_key parameter."
-            )
-        openai.api_key = key
+                f"Unexpected response format from OpenAI API in {self.name}: {exc}"
+            ) from exc
 
-    def run(self, task: str, *, api_key: Optional[str] = None, temperature: float = 0.7) -> str:
-        """Execute this agent on the given task.
+    def run_stream(self, task: str, *, api_key: Optional[str] = None, temperature: float = 0.7) -> Iterator[str]:
+        """Execute this agent on the given task, yielding its output as it is generated.
+
+        The response is streamed from the API, so the first pieces of text are
+        available long before the full completion. A cached response is
+        yielded as a single piece.
 
         Args:
             task: Description of the subtask for the agent to perform.
@@ -68,29 +89,130 @@ class BaseAgent:
                 environment variable ``OPENAI_API_KEY`` is used.
             temperature: Sampling temperature for the language model.
 
-        Returns:
-            The text output produced by the agent.
+        Yields:
+            Consecutive pieces of the agent's output text.
 
         Raises:
             RuntimeError: If the OpenAI API is unavailable or fails.
         """
-        self._ensure_openai(api_key)
-        system_msg = {"role": "system", "content": self.role_prompt}
-        user_msg = {"role": "user", "content": task}
+        client = _get_client(api_key)
+        messages = self.messages(task)
+        embedding = None
+        buffer = io.StringIO()
         try:
-            response = openai.ChatCompletion.create(
+            if self.cache is not None:
+                cached, embedding = self.cache.lookup(client, self.model, messages, temperature)
+                if cached is not None:
+                    yield cached
+                    return
+            stream = client.chat.completions.create(
                 model=self.model,
-                messages=[system_msg, user_msg],
+                messages=messages,
                 temperature=temperature,
+                stream=True,
             )
+            for chunk in stream:
+                text = self._delta(chunk)
+                if text:
+                    buffer.write(text)
+                    yield text
+        except RuntimeError:
+            raise
         except Exception as exc:
             raise RuntimeError(f"{self.name} failed to call OpenAI API: {exc}") from exc
+        if self.cache is not None:
+            self.cache.set(self.model, messages, temperature, buffer.getvalue().strip(), embedding=embedding)
+
+    def run(self, task: str, *, api_key: Optional[str] = None, temperature: float = 0.7) -> str:
+        """Execute this agent on the given task.
+
+        Args:
+            task: Description of the subtask for the agent to perform.
+            api_key: Explicit OpenAI API key. If not provided, the
+                environment variable ``OPENAI_API_KEY`` is used.
+            temperature: Sampling temperature for the language model.
+
+        Returns:
+            The text output produced by the agent.
+
+        Raises:
+            RuntimeError: If the OpenAI API is unavailable or fails.
+        """
+        buffer = io.StringIO()
+        for text in self.run_stream(task, api_key=api_key, temperature=temperature):
+            buffer.write(text)
+        return buffer.getvalue().strip()
+
+    async def run_async(
+        self,
+        task: str,
+        *,
+        api_key: Optional[str] = None,
+        temperature: float = 0.7,
+        rate_limiter: Optional[RateLimiter] = None,
+        on_chunk: Optional[Callable[[str], None]] = None,
+        response_format: Optional[dict] = None,
+    ) -> str:
+        """Asynchronous counterpart of :meth:`run`.
+
+        The request is issued through :class:`openai.AsyncOpenAI`, so several
+        agents can wait on the API concurrently from a single event loop.
+        Rate-limit (HTTP 429) responses are retried with exponential backoff
+        by the OpenAI client itself.
+
+        Args:
+            task: Description of the subtask for the agent to perform.
+            api_key: Explicit OpenAI API key. If not provided, the
+                environment variable ``OPENAI_API_KEY`` is used.
+            temperature: Sampling temperature for the language model.
+            rate_limiter: Optional limiter shared with concurrent requests;
+                the API call waits for capacity before it is sent. Cache
+                hits do not consume capacity.
+            on_chunk: Optional callback invoked with each piece of output
+                text as it is streamed from the API.
+            response_format: Optional ``response_format`` for the request,
+                e.g. ``{"type": "json_object"}``.
+
+        Returns:
+            The text output produced by the agent.
+
+        Raises:
+            RuntimeError: If the OpenAI API is unavailable or fails.
+        """
+        client = _get_async_client(api_key)
+        messages = self.messages(task)
+        embedding = None
+        buffer = io.StringIO()
         try:
-            return response["choices"][0]["message"]["content"].strip()
+            if self.cache is not None:
+                cached, embedding = await self.cache.alookup(client, self.model, messages, temperature)
+                if cached is not None:
+                    if on_chunk is not None:
+                        on_chunk(cached)
+                    return cached
+            options = {"response_format": response_format} if response_format is not None else {}
+            async with throttle(rate_limiter, messages):
+                stream = await client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    temperature=temperature,
+                    stream=True,
+                    **options,
+                )
+                async for chunk in stream:
+                    text = self._delta(chunk)
+                    if text:
+                        buffer.write(text)
+                        if on_chunk is not None:
+                            on_chunk(text)
+        except RuntimeError:
+            raise
         except Exception as exc:
-            raise RuntimeError(
-                f"Unexpected response format from OpenAI API in {self.name}: {exc}"
-            ) from exc
+            raise RuntimeError(f"{self.name} failed to call OpenAI API: {exc}") from exc
+        output = buffer.getvalue().strip()
+        if self.cache is not None:
+            self.cache.set(self.model, messages, temperature, output, embedding=embedding)
+        return output
 
 
 class ResearchAgent(BaseAgent):
@@ -129,18 +251,19 @@ class AdDesignAgent(BaseAgent):
     )
 
 
-def get_default_agents(model: Optional[str] = None) -> list[BaseAgent]:
+def get_default_agents(model: Optional[str] = None, *, cache: Optional[LLMCache] = None) -> list[BaseAgent]:
     """Return a list of default agents used by the orchestrator.
 
     Args:
         model: Optional model override for all agents (default "gpt-4").
+        cache: Optional response cache shared by all agents.
 
     Returns:
         A list containing instances of ResearchAgent, CopywritingAgent and
         AdDesignAgent.
     """
     return [
-        ResearchAgent(model=model) if model else ResearchAgent(),
-        CopywritingAgent(model=model) if model else CopywritingAgent(),
-        AdDesignAgent(model=model) if model else AdDesignAgent(),
+        ResearchAgent(model=model, cache=cache),
+        CopywritingAgent(model=model, cache=cache),
+        AdDesignAgent(model=model, cache=cache),
     ]
\ No newline at end of file
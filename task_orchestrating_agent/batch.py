@@ -0,0 +1,170 @@
+"""Offline execution of many goals through the OpenAI Batch API.
+
+The Batch API accepts a JSONL file of requests, processes it within a 24‑hour
+window and charges half the price of synchronous calls. :func:`run_batch`
+uses it for non-interactive runs over many goals in two rounds: first one
+planning request per goal, then one request per distinct planned subtask.
+The results are aggregated exactly as :meth:`Orchestrator.run` aggregates
+them, into one ``{agent_name: output}`` dictionary per goal.
+
+Example usage::
+
+    from task_orchestrating_agent.agents import get_default_agents
+    from task_orchestrating_agent.batch import run_batch
+    from task_orchestrating_agent.orchestrator import Orchestrator
+    orchestrator = Orchestrator(get_default_agents())
+    results = run_batch(orchestrator, ["Plan a marketing campaign", "Plan a product launch"])
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from typing import Dict, List, Optional, Sequence
+
+from .client import _get_client
+from .orchestrator import PLAN_RESPONSE_FORMAT, Orchestrator, supports_json_mode
+
+#: Endpoint every batched request is sent to.
+ENDPOINT = "/v1/chat/completions"
+#: Statuses after which a batch will not make further progress.
+TERMINAL_STATUSES = frozenset({"completed", "failed", "expired", "cancelled"})
+
+
+def _request_line(custom_id: str, model: str, messages: List[dict], temperature: float, **options: object) -> str:
+    return json.dumps(
+        {
+            "custom_id": custom_id,
+            "method": "POST",
+            "url": ENDPOINT,
+            "body": {"model": model, "messages": messages, "temperature": temperature, **options},
+        },
+        ensure_ascii=False,
+    )
+
+
+def submit_batch(client, lines: Sequence[str], *, poll_interval: float = 30.0) -> Dict[str, str]:
+    """Run a JSONL batch of chat completion requests to completion.
+
+    Args:
+        client: Synchronous OpenAI client.
+        lines: JSONL request lines, each with a unique ``custom_id``.
+        poll_interval: Seconds to wait between status checks.
+
+    Returns:
+        A dictionary mapping each ``custom_id`` to the stripped content of
+        its response.
+
+    Raises:
+        RuntimeError: If the batch or any of its requests fails.
+    """
+    try:
+        input_file = client.files.create(
+            file=("batch.jsonl", "\n".join(lines).encode("utf-8")),
+            purpose="batch",
+        )
+        batch = client.batches.create(
+            input_file_id=input_file.id,
+            endpoint=ENDPOINT,
+            completion_window="24h",
+        )
+        while batch.status not in TERMINAL_STATUSES:
+            time.sleep(poll_interval)
+            batch = client.batches.retrieve(batch.id)
+    except Exception as exc:
+        raise RuntimeError(f"OpenAI batch submission failed: {exc}") from exc
+    if batch.status != "completed" or not batch.output_file_id:
+        raise RuntimeError(f"OpenAI batch {batch.id} finished with status '{batch.status}'.")
+    try:
+        output = client.files.content(batch.output_file_id).text
+    except Exception as exc:
+        raise RuntimeError(f"Failed to download results of OpenAI batch {batch.id}: {exc}") from exc
+    contents: Dict[str, str] = {}
+    for line in output.splitlines():
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        custom_id = record.get("custom_id")
+        response = record.get("response") or {}
+        if record.get("error") or response.get("status_code") != 200:
+            raise RuntimeError(
+                f"Batched request {custom_id} failed: {record.get('error') or response.get('body')}"
+            )
+        try:
+            contents[custom_id] = response["body"]["choices"][0]["message"]["content"].strip()
+        except Exception as exc:
+            raise RuntimeError(f"Unexpected response format for batched request {custom_id}: {exc}") from exc
+    expected = (json.loads(line)["custom_id"] for line in lines)
+    missing = [custom_id for custom_id in expected if custom_id not in contents]
+    if missing:
+        raise RuntimeError(f"OpenAI batch {batch.id} returned no result for: {', '.join(missing)}")
+    return contents
+
+
+def run_batch(
+    orchestrator: Orchestrator,
+    goals: Sequence[str],
+    *,
+    api_key: Optional[str] = None,
+    temperature: float = 0.7,
+    planning_temperature: float = 0.3,
+    poll_interval: float = 30.0,
+) -> Dict[str, Dict[str, str]]:
+    """Plan and execute many goals through the OpenAI Batch API.
+
+    Args:
+        orchestrator: Orchestrator providing the agents and planning prompt.
+        goals: The high‑level objectives to accomplish. Duplicates are
+            processed once.
+        api_key: Explicit OpenAI API key. If omitted, the ``OPENAI_API_KEY``
+            environment variable is used.
+        temperature: Sampling temperature for the worker agents.
+        planning_temperature: Sampling temperature for the planning requests.
+        poll_interval: Seconds to wait between batch status checks.
+
+    Returns:
+        A dictionary mapping each goal to its ``{agent_name: output}`` results.
+
+    Raises:
+        RuntimeError: If a batch, a request or a plan fails.
+    """
+    unique_goals = list(dict.fromkeys(goals))
+    if not unique_goals:
+        return {}
+    client = _get_client(api_key)
+
+    # Round 1: one planning request per goal.
+    plan_options = (
+        {"response_format": PLAN_RESPONSE_FORMAT} if supports_json_mode(orchestrator.planning_model) else {}
+    )
+    plan_lines = [
+        _request_line(
+            f"{index}-plan",
+            orchestrator.planning_model,
+            orchestrator.plan_messages(goal),
+            planning_temperature,
+            **plan_options,
+        )
+        for index, goal in enumerate(unique_goals)
+    ]
+    plan_texts = submit_batch(client, plan_lines, poll_interval=poll_interval)
+    plans = {index: orchestrator.parse_plan(plan_texts[f"{index}-plan"]) for index in range(len(unique_goals))}
+    assignments = {index: orchestrator.assign(goal, plans[index]) for index, goal in enumerate(unique_goals)}
+    subtasks = {index: orchestrator.unique_subtasks(plans[index], assignments[index]) for index in plans}
+
+    # Round 2: one request per distinct planned subtask.
+    agent_lines = [
+        _request_line(f"{index}-{position}-{agent.name}", agent.model, agent.messages(prompt), temperature)
+        for index, goal_subtasks in subtasks.items()
+        for position, (agent, _, prompt) in enumerate(goal_subtasks.values())
+    ]
+    outputs = submit_batch(client, agent_lines, poll_interval=poll_interval) if agent_lines else {}
+
+    results: Dict[str, Dict[str, str]] = {}
+    for index, goal in enumerate(unique_goals):
+        outputs_by_task = {
+            task_key: outputs[f"{index}-{position}-{agent.name}"]
+            for position, (task_key, (agent, _, _)) in enumerate(subtasks[index].items())
+        }
+        results[goal] = orchestrator.join_outputs(plans[index], assignments[index], outputs_by_task)
+    return results
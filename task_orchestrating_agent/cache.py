@@ -0,0 +1,360 @@
+"""Response and plan caching for the Task Orchestrating Agent system.
+
+:class:`LLMCache` stores agent responses in a local SQLite database so that
+repeating a subtask with the same model, role prompt, task and temperature
+returns immediately instead of calling the OpenAI API again. Lookups first
+try an exact match on a SHA-256 digest of the request. When semantic
+matching is enabled, a miss falls back to comparing an embedding of the
+task against the tasks previously answered under the same model, role
+prompt and temperature, and a sufficiently similar entry is returned.
+
+Only deterministic requests (``temperature == 0``) are cached; replaying a
+sampled response would silently change the meaning of a non-zero
+temperature.
+
+:class:`PlanCache` stores the decompositions produced by the orchestrator
+together with an embedding of their goal. A new goal that is close enough
+to a cached one reuses that plan as a template, either verbatim or adapted
+to the new goal by a smaller model, instead of running a full planning
+request.
+
+Example usage::
+
+    from task_orchestrating_agent.agents import get_default_agents
+    from task_orchestrating_agent.cache import LLMCache, PlanCache
+    from task_orchestrating_agent.orchestrator import Orchestrator
+    agents = get_default_agents(cache=LLMCache(semantic=True))
+    orchestrator = Orchestrator(agents, plan_cache=PlanCache())
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import math
+import sqlite3
+from array import array
+from pathlib import Path
+from typing import List, Optional, Sequence, Tuple, Union
+
+Plan = List[Tuple[str, str]]
+
+#: Default location of the cache database.
+DEFAULT_CACHE_PATH = Path("~/.toa/cache.db")
+#: Embedding model used for semantic matching.
+EMBEDDING_MODEL = "text-embedding-3-small"
+#: Model used to adapt a cached plan to a new goal.
+ADAPT_MODEL = "gpt-4o-mini"
+
+
+def _digest(payload: object) -> str:
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def _pack(vector: Sequence[float]) -> bytes:
+    return array("f", vector).tobytes()
+
+
+def _unpack(blob: bytes) -> array:
+    vector = array("f")
+    vector.frombytes(blob)
+    return vector
+
+
+def cosine_similarity(a: Sequence[float], b: Sequence[float]) -> float:
+    """Return the cosine similarity of two equal-length vectors."""
+    dot = sum(x * y for x, y in zip(a, b))
+    norm = math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b))
+    return dot / norm if norm else 0.0
+
+
+def open_database(path: Union[str, Path]) -> sqlite3.Connection:
+    """Open (creating if needed) the SQLite database at ``path``."""
+    db_path = Path(path).expanduser()
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+    return sqlite3.connect(str(db_path), check_same_thread=False)
+
+
+class LLMCache:
+    """SQLite-backed cache of chat completion responses.
+
+    Entries are keyed on ``(model, messages, temperature)``. The final
+    message of a request is treated as the task; everything before it
+    (model, system prompt, temperature) forms the *scope* within which
+    semantic near-matches are searched.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path] = DEFAULT_CACHE_PATH,
+        *,
+        semantic: bool = False,
+        threshold: float = 0.92,
+        embedding_model: str = EMBEDDING_MODEL,
+    ) -> None:
+        """Open the cache.
+
+        Args:
+            path: Location of the SQLite database (default: ``~/.toa/cache.db``).
+            semantic: Whether to fall back to embedding similarity on an
+                exact-match miss.
+            threshold: Minimum cosine similarity for a semantic hit.
+            embedding_model: OpenAI embedding model used for semantic matching.
+        """
+        self.semantic = semantic
+        self.threshold = threshold
+        self.embedding_model = embedding_model
+        self._conn = open_database(path)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache ("
+                "key TEXT PRIMARY KEY, scope TEXT NOT NULL, response TEXT NOT NULL, embedding BLOB)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS llm_cache_scope ON llm_cache (scope)")
+
+    @staticmethod
+    def accepts(temperature: float) -> bool:
+        """Return whether requests at ``temperature`` are cacheable."""
+        return temperature == 0
+
+    @staticmethod
+    def cache_key(model: str, messages: List[dict], temperature: float) -> str:
+        """Return the exact-match key for a request."""
+        return _digest({"model": model, "messages": messages, "temperature": temperature})
+
+    @staticmethod
+    def _scope(model: str, messages: List[dict], temperature: float) -> str:
+        return _digest({"model": model, "messages": messages[:-1], "temperature": temperature})
+
+    def get(
+        self,
+        model: str,
+        messages: List[dict],
+        temperature: float,
+        *,
+        embedding: Optional[Sequence[float]] = None,
+    ) -> Optional[str]:
+        """Return a cached response for the request, if any.
+
+        Args:
+            model: Model name of the request.
+            messages: Chat messages of the request.
+            temperature: Sampling temperature of the request.
+            embedding: Embedding of the final message. When given, the most
+                similar entry in the same scope is returned if its similarity
+                reaches the threshold.
+
+        Returns:
+            The cached response text, or ``None`` on a miss.
+        """
+        if not self.accepts(temperature):
+            return None
+        row = self._conn.execute(
+            "SELECT response FROM llm_cache WHERE key = ?",
+            (self.cache_key(model, messages, temperature),),
+        ).fetchone()
+        if row is not None:
+            return row[0]
+        if embedding is None:
+            return None
+        best: Optional[str] = None
+        best_score = self.threshold
+        rows = self._conn.execute(
+            "SELECT response, embedding FROM llm_cache WHERE scope = ? AND embedding IS NOT NULL",
+            (self._scope(model, messages, temperature),),
+        )
+        for response, blob in rows:
+            score = cosine_similarity(embedding, _unpack(blob))
+            if score >= best_score:
+                best, best_score = response, score
+        return best
+
+    def set(
+        self,
+        model: str,
+        messages: List[dict],
+        temperature: float,
+        response: str,
+        *,
+        embedding: Optional[Sequence[float]] = None,
+    ) -> None:
+        """Store a response for the request.
+
+        Requests that are not cacheable (see :meth:`accepts`) are ignored.
+        """
+        if not self.accepts(temperature):
+            return
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, scope, response, embedding) VALUES (?, ?, ?, ?)",
+                (
+                    self.cache_key(model, messages, temperature),
+                    self._scope(model, messages, temperature),
+                    response,
+                    _pack(embedding) if embedding is not None else None,
+                ),
+            )
+
+    def lookup(self, client, model: str, messages: List[dict], temperature: float) -> Tuple[Optional[str], Optional[List[float]]]:
+        """Look up a request, embedding its task on an exact-match miss.
+
+        Args:
+            client: OpenAI client used to compute the embedding.
+            model: Model name of the request.
+            messages: Chat messages of the request.
+            temperature: Sampling temperature of the request.
+
+        Returns:
+            A ``(response, embedding)`` tuple. ``response`` is ``None`` on a
+            miss; ``embedding`` is the computed task embedding, if any, and
+            should be passed back to :meth:`set`. A failed embedding request
+            counts as a miss without an embedding.
+        """
+        if not self.accepts(temperature):
+            return None, None
+        hit = self.get(model, messages, temperature)
+        if hit is not None or not self.semantic:
+            return hit, None
+        try:
+            result = client.embeddings.create(model=self.embedding_model, input=messages[-1]["content"])
+            embedding = result.data[0].embedding
+        except Exception:
+            # The cache is only an optimisation; let the request go ahead
+            return None, None
+        return self.get(model, messages, temperature, embedding=embedding), embedding
+
+    async def alookup(self, client, model: str, messages: List[dict], temperature: float) -> Tuple[Optional[str], Optional[List[float]]]:
+        """Asynchronous counterpart of :meth:`lookup` for ``AsyncOpenAI`` clients."""
+        if not self.accepts(temperature):
+            return None, None
+        hit = self.get(model, messages, temperature)
+        if hit is not None or not self.semantic:
+            return hit, None
+        try:
+            result = await client.embeddings.create(model=self.embedding_model, input=messages[-1]["content"])
+            embedding = result.data[0].embedding
+        except Exception:
+            # The cache is only an optimisation; let the request go ahead
+            return None, None
+        return self.get(model, messages, temperature, embedding=embedding), embedding
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
+
+
+class PlanCache:
+    """SQLite-backed cache of orchestration plans keyed by goal embedding.
+
+    Plans are grouped by *scope*, a digest of the agent descriptions shown to
+    the planner, so a plan is only reused with the same set of agents.
+    """
+
+    def __init__(
+        self,
+        path: Union[str, Path] = DEFAULT_CACHE_PATH,
+        *,
+        threshold: float = 0.90,
+        adapt: bool = True,
+        adapt_model: str = ADAPT_MODEL,
+        embedding_model: str = EMBEDDING_MODEL,
+    ) -> None:
+        """Open the plan cache.
+
+        Args:
+            path: Location of the SQLite database (default: ``~/.toa/cache.db``).
+            threshold: Minimum cosine similarity between goals for a hit.
+            adapt: Whether a plan cached for a different goal is rewritten for
+                the new goal by ``adapt_model`` (``True``) or reused verbatim.
+            adapt_model: OpenAI model used for adaptation (default: "gpt-4o-mini").
+            embedding_model: OpenAI embedding model used for goal embeddings.
+        """
+        self.threshold = threshold
+        self.adapt = adapt
+        self.adapt_model = adapt_model
+        self.embedding_model = embedding_model
+        self._conn = open_database(path)
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS plan_cache ("
+                "id INTEGER PRIMARY KEY, scope TEXT NOT NULL, goal TEXT NOT NULL, "
+                "plan TEXT NOT NULL, embedding BLOB NOT NULL)"
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS plan_cache_scope ON plan_cache (scope, goal)")
+
+    @staticmethod
+    def scope(agents_description: str) -> str:
+        """Return the scope key for plans made with the described agents."""
+        return _digest(agents_description)
+
+    async def aembed(self, client, goal: str) -> List[float]:
+        """Embed ``goal`` with an ``AsyncOpenAI`` client."""
+        result = await client.embeddings.create(model=self.embedding_model, input=goal)
+        return result.data[0].embedding
+
+    def get(
+        self, scope: str, goal: str, *, embedding: Optional[Sequence[float]] = None
+    ) -> Optional[Tuple[str, Plan]]:
+        """Return the cached plan closest to ``goal``, if any.
+
+        An identical goal always matches. Otherwise, when ``embedding`` is
+        given, the most similar cached goal in ``scope`` is returned if its
+        similarity reaches the threshold.
+
+        Returns:
+            A ``(cached_goal, plan)`` tuple, or ``None`` on a miss.
+        """
+        row = self._conn.execute(
+            "SELECT goal, plan FROM plan_cache WHERE scope = ? AND goal = ? ORDER BY id DESC LIMIT 1",
+            (scope, goal),
+        ).fetchone()
+        if row is None and embedding is not None:
+            best_score = self.threshold
+            for cached_goal, plan, blob in self._conn.execute(
+                "SELECT goal, plan, embedding FROM plan_cache WHERE scope = ?", (scope,)
+            ):
+                score = cosine_similarity(embedding, _unpack(blob))
+                if score >= best_score:
+                    row, best_score = (cached_goal, plan), score
+        if row is None:
+            return None
+        return row[0], [(agent, task) for agent, task in json.loads(row[1])]
+
+    def add(self, scope: str, goal: str, plan: Plan, embedding: Sequence[float]) -> None:
+        """Store a successful plan for ``goal``."""
+        with self._conn:
+            self._conn.execute(
+                "INSERT INTO plan_cache (scope, goal, plan, embedding) VALUES (?, ?, ?, ?)",
+                (scope, goal, json.dumps(plan, ensure_ascii=False), _pack(embedding)),
+            )
+
+    @staticmethod
+    def adaptation_messages(cached_goal: str, plan: Plan, goal: str) -> List[dict]:
+        """Build the chat messages asking a model to adapt ``plan`` to ``goal``."""
+        template = json.dumps([{"agent": agent, "task": task} for agent, task in plan], ensure_ascii=False)
+        return [
+            {
+                "role": "system",
+                "content": (
+                    "You are a Task Orchestrator Agent. You adapt an existing plan, made for a similar "
+                    "goal, to a new goal. Keep the same agents and structure unless the new goal requires "
+                    "otherwise. Return the adapted plan as a JSON object with a single key 'plan' holding "
+                    "an array. Each entry must have two keys: "
+                    "'agent' (the name of the agent to perform the task) and 'task' (a short description of the subtask)."
+                ),
+            },
+            {
+                "role": "user",
+                "content": (
+                    f"Original goal: {cached_goal}\n\n"
+                    f"Original plan:\n{template}\n\n"
+                    f"New goal: {goal}\n\n"
+                    "Adapt the plan to the new goal. Format your response as JSON."
+                ),
+            },
+        ]
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        self._conn.close()
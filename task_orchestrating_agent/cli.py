@@ -8,30 +8,88 @@ to decompose the goal and delegate work to worker agents.
 Example::
 
     python -m task_orchestrating_agent.cli "Plan a marketing campaign" \
-        --api-key sk-... --model gpt-4o
+        --api-key sk-... --model gpt-4o --planning-model gpt-4o-mini
+
+Several goals can be processed at once by listing them, one per line, in a
+file passed with ``--goals-file``. Adding ``--batch`` submits all requests
+through the OpenAI Batch API, which is cheaper but may take up to 24 hours::
+
+    python -m task_orchestrating_agent.cli --goals-file goals.txt --batch
 
 If no API key is provided, the ``OPENAI_API_KEY`` environment variable is
-used. The output is printed to standard output.
+used. The output is printed to standard output. With ``--stream``, agent
+output is also shown line by line while it is generated.
+
+For repeated runs, ``--daemon`` starts a long-lived process that keeps its
+OpenAI connections warm (see :mod:`task_orchestrating_agent.daemon`). While
+it is running, single-goal invocations are forwarded to it automatically;
+pass ``--no-daemon`` to run locally anyway.
 """
 
 from __future__ import annotations
 
 import argparse
+import asyncio
 import json
+import sys
 from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Dict, List, Optional, Sequence, TextIO
+
+try:
+    import orjson  # type: ignore
+except ImportError:  # pragma: no cover
+    orjson = None
+
+from .daemon import DEFAULT_SOCKET_PATH, forward_goal, serve
+
+# The orchestration modules import the OpenAI client, which dominates start-up
+# time. They are imported where they are used, so that forwarding a goal to a
+# running daemon does not pay for them.
+if TYPE_CHECKING:  # pragma: no cover
+    from .orchestrator import Orchestrator
+
+# Defaults of --model, --planning-model and --temperature. The options
+# themselves default to None so that a goal forwarded to a daemon only
+# carries the values the user set; the daemon fills in its own.
+DEFAULT_MODEL = "gpt-4"
+DEFAULT_PLANNING_MODEL = "gpt-4o-mini"
+DEFAULT_TEMPERATURE = 0.7
+
+
+def _positive(convert: Callable[[str], float]) -> Callable[[str], float]:
+    """Build an argparse ``type`` that only accepts values greater than zero."""
 
-from .agents import get_default_agents
-from .orchestrator import Orchestrator
+    def parse(value: str) -> float:
+        try:
+            number = convert(value)
+        except ValueError:
+            raise argparse.ArgumentTypeError(f"invalid number: {value!r}") from None
+        if number <= 0:
+            raise argparse.ArgumentTypeError(f"must be greater than 0, got {value}")
+        return number
 
+    return parse
 
-def parse_args() -> argparse.Namespace:
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
     parser = argparse.ArgumentParser(
         description="Run the Task Orchestrating Agent on a high-level goal and print the results."
     )
     parser.add_argument(
         "goal",
+        nargs="?",
         help="The high-level goal to be decomposed and delegated.",
     )
+    parser.add_argument(
+        "--goals-file",
+        default=None,
+        help="Path to a file with one goal per line; results are keyed by goal.",
+    )
+    parser.add_argument(
+        "--batch",
+        action="store_true",
+        help="With --goals-file, run all requests through the OpenAI Batch API (50%% cheaper, up to 24h).",
+    )
     parser.add_argument(
         "--api-key",
         default=None,
@@ -39,24 +97,282 @@ def parse_args() -> argparse.Namespace:
     )
     parser.add_argument(
         "--model",
-        default="gpt-4",
-        help="OpenAI model to use for both planning and agents (default: gpt-4).",
+        default=None,
+        help=f"OpenAI model used by the worker agents (default: {DEFAULT_MODEL}).",
+    )
+    parser.add_argument(
+        "--planning-model",
+        default=None,
+        help=f"OpenAI model used by the orchestrator to plan subtasks (default: {DEFAULT_PLANNING_MODEL}).",
+    )
+    parser.add_argument(
+        "--temperature",
+        type=float,
+        default=None,
+        help=f"Sampling temperature for the worker agents (default: {DEFAULT_TEMPERATURE}).",
+    )
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Cache agent responses in ~/.toa/cache.db (requires --temperature 0).",
+    )
+    parser.add_argument(
+        "--semantic-cache",
+        action="store_true",
+        help="With --cache, also reuse responses for near-identical subtasks (uses embeddings).",
+    )
+    parser.add_argument(
+        "--plan-cache",
+        action="store_true",
+        help="Reuse cached plans for similar goals, adapted to the new goal by gpt-4o-mini.",
+    )
+    parser.add_argument(
+        "--max-rpm",
+        type=_positive(float),
+        default=None,
+        help="Throttle OpenAI requests to this many per minute (default: unlimited).",
+    )
+    parser.add_argument(
+        "--max-tpm",
+        type=_positive(float),
+        default=None,
+        help="Throttle OpenAI requests to about this many tokens per minute (default: unlimited).",
+    )
+    parser.add_argument(
+        "--max-concurrency",
+        type=_positive(int),
+        default=None,
+        help="Maximum number of OpenAI requests in flight at once (default: unlimited).",
+    )
+    parser.add_argument(
+        "--stream",
+        action="store_true",
+        help=(
+            "Show agent output live as it is generated, prefixed with the agent name "
+            "(on stderr unless --output is given)."
+        ),
+    )
+    parser.add_argument(
+        "--daemon",
+        action="store_true",
+        help="Run as a daemon serving goals on --socket with these options, keeping connections warm.",
+    )
+    parser.add_argument(
+        "--no-daemon",
+        action="store_true",
+        help="Run locally even if a daemon is listening on --socket.",
+    )
+    parser.add_argument(
+        "--socket",
+        default=str(DEFAULT_SOCKET_PATH),
+        help=f"Unix socket of the daemon (default: {DEFAULT_SOCKET_PATH}).",
     )
     parser.add_argument(
         "--output",
         default=None,
         help="Optional path to write the JSON results (prints to stdout if omitted).",
     )
-    return parser.parse_args()
+    args = parser.parse_args(argv)
+    # Only deterministic responses are cached, so these flags would do nothing
+    if args.semantic_cache and not args.cache:
+        parser.error("--semantic-cache requires --cache")
+    if args.cache and _temperature(args) != 0:
+        parser.error("--cache requires --temperature 0")
+    if args.daemon:
+        if args.goal is not None or args.goals_file is not None:
+            parser.error("--daemon does not take a goal")
+        return args
+    if (args.goal is None) == (args.goals_file is None):
+        parser.error("provide either a goal or --goals-file")
+    if args.batch and args.goals_file is None:
+        parser.error("--batch requires --goals-file")
+    if args.batch and args.stream:
+        parser.error("--stream cannot be combined with --batch")
+    # Batch jobs run offline on OpenAI's side, without caching or throttling
+    if args.batch and _cache_and_limit_flags(args):
+        parser.error(f"{_cache_and_limit_flags(args)[0]} cannot be combined with --batch")
+    return args
+
+
+def _cache_and_limit_flags(args: argparse.Namespace) -> List[str]:
+    """Return the caching and rate-limiting options given on the command line."""
+    flags = [
+        ("--cache", args.cache),
+        ("--semantic-cache", args.semantic_cache),
+        ("--plan-cache", args.plan_cache),
+        ("--max-rpm", args.max_rpm is not None),
+        ("--max-tpm", args.max_tpm is not None),
+        ("--max-concurrency", args.max_concurrency is not None),
+    ]
+    return [flag for flag, given in flags if given]
+
+
+def _temperature(args: argparse.Namespace) -> float:
+    """Return the ``--temperature`` option, or its default if it was not given."""
+    return DEFAULT_TEMPERATURE if args.temperature is None else args.temperature
+
+
+def read_goals(path: str) -> List[str]:
+    """Read one goal per non-empty line from ``path``."""
+    text = Path(path).expanduser().read_text(encoding="utf-8")
+    return [line.strip() for line in text.splitlines() if line.strip()]
+
+
+class StreamPrinter:
+    """Print streamed agent output line by line, prefixed with the agent name.
+
+    Chunks from concurrently running agents arrive interleaved; buffering
+    them per agent until a line is complete keeps every printed line
+    attributable to a single agent.
+    """
+
+    def __init__(self, file: TextIO) -> None:
+        self.file = file
+        self._pending: Dict[str, str] = {}
+
+    def __call__(self, agent_name: str, text: str) -> None:
+        *lines, rest = (self._pending.get(agent_name, "") + text).split("\n")
+        for line in lines:
+            print(f"[{agent_name}] {line}", file=self.file, flush=True)
+        self._pending[agent_name] = rest
+
+    def flush(self) -> None:
+        """Print any incomplete last lines."""
+        for agent_name, rest in self._pending.items():
+            if rest:
+                print(f"[{agent_name}] {rest}", file=self.file, flush=True)
+        self._pending.clear()
+
+
+def _label_chunks(on_chunk: Callable[[str, str], None], label: str) -> Callable[[str, str], None]:
+    return lambda agent_name, text: on_chunk(f"{label} / {agent_name}", text)
+
+
+async def _run_goals(
+    orchestrator: Orchestrator,
+    goals: List[str],
+    *,
+    api_key: Optional[str],
+    temperature: float,
+    on_chunk: Optional[Callable[[str, str], None]],
+) -> Dict[str, Dict[str, str]]:
+    from .client import aclose_async_clients
+
+    unique_goals = list(dict.fromkeys(goals))
+    try:
+        outputs = await asyncio.gather(
+            *(
+                orchestrator.run_async(
+                    goal,
+                    api_key=api_key,
+                    temperature=temperature,
+                    on_chunk=_label_chunks(on_chunk, f"goal {index + 1}") if on_chunk is not None else None,
+                )
+                for index, goal in enumerate(unique_goals)
+            )
+        )
+    finally:
+        await aclose_async_clients()
+    return dict(zip(unique_goals, outputs))
+
+
+def build_orchestrator(
+    args: argparse.Namespace, model: Optional[str] = None, planning_model: Optional[str] = None
+) -> Orchestrator:
+    """Build an orchestrator configured by the CLI options.
+
+    Args:
+        args: Parsed CLI options.
+        model: Overrides ``--model`` when given.
+        planning_model: Overrides ``--planning-model`` when given.
+    """
+    from .agents import get_default_agents
+    from .cache import LLMCache, PlanCache
+    from .orchestrator import Orchestrator
+    from .ratelimit import RateLimiter
+
+    cache = LLMCache(semantic=args.semantic_cache) if args.cache else None
+    agents = get_default_agents(model=model or args.model or DEFAULT_MODEL, cache=cache)
+    plan_cache = PlanCache() if args.plan_cache else None
+    rate_limiter = None
+    if args.max_rpm or args.max_tpm or args.max_concurrency:
+        rate_limiter = RateLimiter(
+            max_requests_per_minute=args.max_rpm,
+            max_tokens_per_minute=args.max_tpm,
+            max_concurrency=args.max_concurrency,
+        )
+    return Orchestrator(
+        agents,
+        planning_model=planning_model or args.planning_model or DEFAULT_PLANNING_MODEL,
+        plan_cache=plan_cache,
+        rate_limiter=rate_limiter,
+    )
+
 
+def _run_locally(args: argparse.Namespace) -> Dict:
+    from .batch import run_batch
 
-def main() -> None:
-    args = parse_args()
-    agents = get_default_agents(model=args.model)
-    orchestrator = Orchestrator(agents, model=args.model)
-    results = orchestrator.run(args.goal, api_key=args.api_key)
+    orchestrator = build_orchestrator(args)
+    # Live output goes to stderr when stdout is reserved for the JSON results
+    printer = StreamPrinter(sys.stdout if args.output else sys.stderr) if args.stream else None
+    if args.goals_file is None:
+        results = orchestrator.run(
+            args.goal, api_key=args.api_key, temperature=_temperature(args), on_chunk=printer
+        )
+    elif args.batch:
+        results = run_batch(
+            orchestrator, read_goals(args.goals_file), api_key=args.api_key, temperature=_temperature(args)
+        )
+    else:
+        results = asyncio.run(
+            _run_goals(
+                orchestrator,
+                read_goals(args.goals_file),
+                api_key=args.api_key,
+                temperature=_temperature(args),
+                on_chunk=printer,
+            )
+        )
+    if printer is not None:
+        printer.flush()
+    return results
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    args = parse_args(argv)
+    if args.daemon:
+        try:
+            asyncio.run(
+                serve(
+                    lambda model, planning_model: build_orchestrator(args, model, planning_model),
+                    socket_path=args.socket,
+                    api_key=args.api_key,
+                    temperature=_temperature(args),
+                )
+            )
+        except KeyboardInterrupt:
+            pass
+        return
+    results = None
+    # Caching and rate limiting belong to the daemon process, so a run that
+    # asks for them is not forwarded. Models and temperature not given here
+    # fall back to those the daemon was started with.
+    if args.goals_file is None and not args.stream and not args.no_daemon and not _cache_and_limit_flags(args):
+        results = forward_goal(
+            args.goal,
+            socket_path=args.socket,
+            api_key=args.api_key,
+            model=args.model,
+            planning_model=args.planning_model,
+            temperature=args.temperature,
+        )
+    if results is None:
+        results = _run_locally(args)
     # Serialize results as JSON for easy consumption
-    serialized = json.dumps(results, indent=2, ensure_ascii=False)
+    if orjson is not None:
+        serialized = orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+    else:
+        serialized = json.dumps(results, indent=2, ensure_ascii=False)
     if args.output:
         output_path = Path(args.output).expanduser().resolve()
         output_path.write_text(serialized, encoding="utf-8")
@@ -0,0 +1,197 @@
+"""Shared OpenAI clients for the Task Orchestrating Agent system.
+
+Agents and the orchestrator obtain their OpenAI clients from this module
+instead of constructing a new client per request. Clients are cached per
+``(api_key, base_url)`` pair and sit on top of a keep-alive ``httpx``
+connection pool (HTTP/2 when the optional ``h2`` package is installed), so
+consecutive calls reuse an established TLS connection rather than paying
+for a fresh handshake each time.
+
+Asynchronous clients are additionally scoped to the running event loop,
+because ``httpx.AsyncClient`` connections cannot be shared between loops.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import functools
+import os
+import threading
+import weakref
+from typing import Dict, Optional, Tuple
+
+try:
+    import openai  # type: ignore
+except ImportError:  # pragma: no cover
+    openai = None
+
+try:
+    import httpx  # type: ignore
+except ImportError:  # pragma: no cover
+    httpx = None
+
+try:
+    import h2  # type: ignore  # noqa: F401
+
+    HTTP2_AVAILABLE = True
+except ImportError:  # pragma: no cover
+    HTTP2_AVAILABLE = False
+
+#: Maximum number of idle connections kept open per client.
+MAX_KEEPALIVE_CONNECTIONS = 32
+#: Seconds an idle connection is kept open before being closed.
+KEEPALIVE_EXPIRY = 180.0
+#: Overall request timeout and connect timeout, in seconds.
+REQUEST_TIMEOUT = 600.0
+CONNECT_TIMEOUT = 5.0
+
+_ClientKey = Tuple[str, Optional[str]]
+
+_clients: Dict[_ClientKey, "openai.OpenAI"] = {}
+# Event loop -> {client key -> AsyncOpenAI}
+_async_clients: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+_lock = threading.Lock()
+
+
+def _ensure_available() -> None:
+    if openai is None:
+        raise RuntimeError(
+            "The openai package is not installed. Install it with `pip install openai`."
+        )
+
+
+def _client_key(api_key: str) -> _ClientKey:
+    return api_key, os.getenv("OPENAI_BASE_URL") or None
+
+
+def _http_options() -> dict:
+    return {
+        "http2": HTTP2_AVAILABLE,
+        "timeout": httpx.Timeout(REQUEST_TIMEOUT, connect=CONNECT_TIMEOUT),
+        "limits": httpx.Limits(
+            max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=KEEPALIVE_EXPIRY,
+        ),
+    }
+
+
+def get_client(api_key: str) -> "openai.OpenAI":
+    """Return the shared synchronous OpenAI client for ``api_key``.
+
+    Args:
+        api_key: The OpenAI API key the client authenticates with.
+
+    Returns:
+        A cached :class:`openai.OpenAI` instance backed by a keep-alive
+        connection pool.
+
+    Raises:
+        RuntimeError: If the openai package is not installed.
+    """
+    _ensure_available()
+    key = _client_key(api_key)
+    with _lock:
+        client = _clients.get(key)
+        if client is None:
+            client = openai.OpenAI(
+                api_key=api_key,
+                base_url=key[1],
+                http_client=httpx.Client(**_http_options()),
+            )
+            _clients[key] = client
+        return client
+
+
+@functools.lru_cache(maxsize=4)
+def _resolve_api_key(api_key: Optional[str]) -> str:
+    _ensure_available()
+    key = api_key or os.getenv("OPENAI_API_KEY")
+    if not key:
+        raise RuntimeError(
+            "No OpenAI API key provided. Set the OPENAI_API_KEY environment variable or pass the api_key parameter."
+        )
+    return key
+
+
+@functools.lru_cache(maxsize=4)
+def _get_client(api_key: Optional[str]) -> "openai.OpenAI":
+    """Resolve ``api_key`` and return the shared synchronous client.
+
+    The result is memoised per process, so repeated calls skip the
+    availability check, the environment lookup and the client lock.
+
+    Args:
+        api_key: Explicit OpenAI API key, or ``None`` to use the
+            ``OPENAI_API_KEY`` environment variable.
+
+    Raises:
+        RuntimeError: If the openai package is not installed or no API key
+            is available.
+    """
+    return get_client(_resolve_api_key(api_key))
+
+
+def get_async_client(api_key: str) -> "openai.AsyncOpenAI":
+    """Return the shared asynchronous OpenAI client for ``api_key``.
+
+    Must be called from within a running event loop; the returned client is
+    only valid inside that loop.
+
+    Args:
+        api_key: The OpenAI API key the client authenticates with.
+
+    Returns:
+        A cached :class:`openai.AsyncOpenAI` instance backed by a keep-alive
+        connection pool.
+
+    Raises:
+        RuntimeError: If the openai package is not installed.
+    """
+    _ensure_available()
+    loop = asyncio.get_running_loop()
+    key = _client_key(api_key)
+    clients = _async_clients.setdefault(loop, {})
+    client = clients.get(key)
+    if client is None:
+        client = openai.AsyncOpenAI(
+            api_key=api_key,
+            base_url=key[1],
+            http_client=httpx.AsyncClient(**_http_options()),
+        )
+        clients[key] = client
+    return client
+
+
+def _get_async_client(api_key: Optional[str]) -> "openai.AsyncOpenAI":
+    """Resolve ``api_key`` and return the running loop's shared client.
+
+    Asynchronous counterpart of :func:`_get_client`. The resolved key is
+    memoised per process; the client itself stays scoped to the event loop.
+
+    Raises:
+        RuntimeError: If the openai package is not installed or no API key
+            is available.
+    """
+    return get_async_client(_resolve_api_key(api_key))
+
+
+async def aclose_async_clients() -> None:
+    """Close the asynchronous clients bound to the running event loop."""
+    clients = _async_clients.pop(asyncio.get_running_loop(), {})
+    for client in clients.values():
+        await client.close()
+
+
+async def awarmup(api_key: str) -> None:
+    """Open a connection for ``api_key`` in the running event loop.
+
+    Issues a cheap ``models.list()`` request through the client returned by
+    :func:`get_async_client`, so that the next request made from this loop
+    finds an established connection in the pool. Long-lived processes such
+    as the daemon call it at startup. Failures are ignored; the real
+    request will surface them.
+    """
+    try:
+        await get_async_client(api_key).models.list()
+    except Exception:
+        pass
@@ -0,0 +1,205 @@
+"""Long-running daemon that keeps a warm orchestrator between CLI invocations.
+
+Every CLI run otherwise pays for interpreter start-up, importing the OpenAI
+client and fresh TLS handshakes. :func:`serve` keeps one event loop, and
+therefore one pool of keep-alive connections, alive behind a Unix socket
+(``~/.toa/daemon.sock`` by default). The CLI detects a running daemon and
+forwards its goal with :func:`forward_goal` instead of orchestrating
+locally. This module only imports the OpenAI machinery inside
+:func:`serve`, so forwarding a goal stays cheap.
+
+The protocol is one JSON object per line. A request has the keys ``goal``
+and optionally ``model``, ``planning_model``, ``temperature`` and
+``api_key``; missing or ``null`` options take the daemon's defaults. The reply is either ``{"results": {...}}`` or
+``{"error": "..."}``.
+
+Start the daemon with::
+
+    python -m task_orchestrating_agent.daemon --planning-model gpt-4o-mini
+
+which accepts the same options as the CLI.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import socket
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Dict, Optional, Tuple, Union
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .orchestrator import Orchestrator
+
+#: Default location of the daemon's Unix socket.
+DEFAULT_SOCKET_PATH = Path("~/.toa/daemon.sock")
+#: Seconds a client waits for the daemon to answer a goal.
+FORWARD_TIMEOUT = 900.0
+
+OrchestratorFactory = Callable[[Optional[str], Optional[str]], "Orchestrator"]
+
+
+def _is_listening(path: Path) -> bool:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(str(path))
+        except OSError:
+            return False
+    return True
+
+
+async def serve(
+    make_orchestrator: OrchestratorFactory,
+    *,
+    socket_path: Union[str, Path] = DEFAULT_SOCKET_PATH,
+    api_key: Optional[str] = None,
+    temperature: float = 0.7,
+) -> None:
+    """Serve orchestration requests on a Unix socket until cancelled.
+
+    Args:
+        make_orchestrator: Called with ``(model, planning_model)`` to build
+            the orchestrator for a request; ``None`` means the daemon's
+            default. Orchestrators are created once per combination and
+            reused.
+        socket_path: Location of the Unix socket.
+        api_key: Default OpenAI API key for requests that do not carry one.
+            If omitted, the ``OPENAI_API_KEY`` environment variable is used.
+        temperature: Sampling temperature for requests that do not carry one.
+
+    Raises:
+        RuntimeError: If another daemon is already listening on the socket.
+    """
+    from .client import aclose_async_clients, awarmup
+
+    path = Path(socket_path).expanduser()
+    path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    if path.exists():
+        if _is_listening(path):
+            raise RuntimeError(f"A daemon is already listening on {path}.")
+        path.unlink()
+    orchestrators: Dict[Tuple[Optional[str], Optional[str]], Orchestrator] = {}
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        try:
+            request = json.loads(await reader.readline())
+            config = (request.get("model"), request.get("planning_model"))
+            if config not in orchestrators:
+                orchestrators[config] = make_orchestrator(*config)
+            request_temperature = request.get("temperature")
+            results = await orchestrators[config].run_async(
+                request["goal"],
+                api_key=request.get("api_key") or api_key,
+                temperature=temperature if request_temperature is None else request_temperature,
+            )
+            reply = {"results": results}
+        except Exception as exc:
+            reply = {"error": str(exc)}
+        writer.write(json.dumps(reply, ensure_ascii=False).encode("utf-8") + b"\n")
+        await writer.drain()
+        writer.close()
+        await writer.wait_closed()
+
+    # Anyone who can connect spends the daemon's API key, so the socket must
+    # never be accessible to other users, not even between bind and chmod.
+    umask = os.umask(0o077)
+    try:
+        server = await asyncio.start_unix_server(handle, path=str(path))
+    finally:
+        os.umask(umask)
+    os.chmod(path, 0o600)
+    key = api_key or os.getenv("OPENAI_API_KEY")
+    if key:
+        # Open the first connection now rather than on the first request
+        await awarmup(key)
+    print(f"Task Orchestrating Agent daemon listening on {path}", file=sys.stderr, flush=True)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        await aclose_async_clients()
+        if path.exists():
+            path.unlink()
+
+
+def forward_goal(
+    goal: str,
+    *,
+    socket_path: Union[str, Path] = DEFAULT_SOCKET_PATH,
+    api_key: Optional[str] = None,
+    model: Optional[str] = None,
+    planning_model: Optional[str] = None,
+    temperature: Optional[float] = None,
+    timeout: float = FORWARD_TIMEOUT,
+) -> Optional[Dict[str, str]]:
+    """Run ``goal`` on a running daemon.
+
+    Args:
+        goal: The high‑level objective to accomplish.
+        socket_path: Location of the daemon's Unix socket.
+        api_key: Explicit OpenAI API key; the daemon's own key is used if omitted.
+        model: Model for the worker agents; the daemon's default if omitted.
+        planning_model: Model for planning; the daemon's default if omitted.
+        temperature: Sampling temperature for the worker agents; the daemon's
+            default if omitted.
+        timeout: Seconds to wait for the daemon before giving up.
+
+    Returns:
+        The results dictionary, or ``None`` if no daemon is listening.
+
+    Raises:
+        RuntimeError: If the daemon reports an error, does not reply in time
+            or closes the connection without a valid reply.
+    """
+    path = Path(socket_path).expanduser()
+    if not hasattr(socket, "AF_UNIX") or not path.exists():
+        return None
+    request = {
+        "goal": goal,
+        "api_key": api_key,
+        "model": model,
+        "planning_model": planning_model,
+        "temperature": temperature,
+    }
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        try:
+            sock.connect(str(path))
+        except (ConnectionRefusedError, FileNotFoundError):
+            # Stale socket left behind by a daemon that is no longer running
+            return None
+        chunks = []
+        try:
+            sock.sendall(json.dumps(request, ensure_ascii=False).encode("utf-8") + b"\n")
+            sock.shutdown(socket.SHUT_WR)
+            while True:
+                data = sock.recv(65536)
+                if not data:
+                    break
+                chunks.append(data)
+        except socket.timeout as exc:
+            raise RuntimeError(f"Daemon on {path} did not reply within {timeout:g} seconds.") from exc
+        except OSError as exc:
+            raise RuntimeError(f"Lost connection to the daemon on {path}: {exc}") from exc
+    try:
+        reply = json.loads(b"".join(chunks))
+    except ValueError as exc:
+        raise RuntimeError(f"Daemon on {path} closed the connection without a valid reply.") from exc
+    if not isinstance(reply, dict) or not ("error" in reply or "results" in reply):
+        raise RuntimeError(f"Daemon on {path} sent an unexpected reply.")
+    if "error" in reply:
+        raise RuntimeError(f"Daemon failed to run goal: {reply['error']}")
+    return reply["results"]
+
+
+def main() -> None:
+    """Start the daemon with the CLI's options."""
+    from .cli import main as cli_main
+
+    cli_main(["--daemon", *sys.argv[1:]])
+
+
+if __name__ == "__main__":  # pragma: no cover
+    main()
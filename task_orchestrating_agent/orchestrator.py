@@ -3,8 +3,9 @@
 The :class:`Orchestrator` is responsible for breaking down a high‑level goal
 into manageable subtasks and delegating those tasks to specialized worker
 agents. It uses the OpenAI API to plan the decomposition and assign tasks,
-then coordinates the execution of each subtask by invoking the appropriate
-agent. The orchestrator aggregates the results and returns them to the caller.
+then coordinates the execution of the subtasks by invoking the appropriate
+agents concurrently. The orchestrator aggregates the results and returns them
+to the caller.
 
 Example usage::
 
@@ -14,20 +15,93 @@ Example usage::
     results = orchestrator.run("Plan a marketing campaign")
     print(results)
 
+From code that already runs an event loop, await
+:meth:`Orchestrator.run_async` instead of calling :meth:`Orchestrator.run`.
+
 """
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import json
-import os
-from typing import Dict, List, Tuple, Optional
+import re
+from collections import defaultdict
+from typing import Callable, Dict, List, Tuple, Optional
 
 try:
-    import openai  # type: ignore
+    import orjson  # type: ignore
 except ImportError:  # pragma: no cover
-    openai = None
+    orjson = None
 
 from .agents import BaseAgent
+from .cache import PlanCache
+from .client import _get_async_client, aclose_async_clients
+from .ratelimit import RateLimiter, throttle
+
+# Matches a response wrapped in a Markdown code fence and captures its body.
+_FENCE_RE = re.compile(r"^```(?:json)?\s*\n(.*?)\n```\s*$", re.DOTALL)
+
+_PLANNER_INSTRUCTIONS = (
+    "You are a Task Orchestrator Agent. Your job is to break complex goals into "
+    "manageable subtasks and assign them to appropriate specialized agents. "
+    "Return your plan as a JSON object with a single key 'plan' holding an array. "
+    "Each entry must have two keys: "
+    "'agent' (the name of the agent to perform the task) and 'task' (a short description of the subtask)."
+)
+
+# JSON mode guarantees the planning response is a single valid JSON object.
+PLAN_RESPONSE_FORMAT = {"type": "json_object"}
+# Batched agent requests return their outputs in a JSON object as well.
+BATCHED_RESPONSE_FORMAT = {"type": "json_object"}
+
+# Chat models released before JSON mode; they reject ``response_format``.
+_MODELS_WITHOUT_JSON_MODE = frozenset(
+    {
+        "gpt-4",
+        "gpt-4-0314",
+        "gpt-4-0613",
+        "gpt-4-32k",
+        "gpt-4-32k-0314",
+        "gpt-4-32k-0613",
+        "gpt-3.5-turbo-0301",
+        "gpt-3.5-turbo-0613",
+        "gpt-3.5-turbo-16k",
+        "gpt-3.5-turbo-16k-0613",
+    }
+)
+
+
+def supports_json_mode(model: str) -> bool:
+    """Return whether ``model`` accepts ``response_format={"type": "json_object"}``."""
+    # Fine-tuned models are named "ft:<base model>:<organization>:..."
+    base_model = model.split(":")[1] if model.startswith("ft:") else model
+    return base_model not in _MODELS_WITHOUT_JSON_MODE
+
+
+def _loads_json(text: str):
+    """Parse ``text`` as JSON, tolerating a Markdown code fence around it."""
+    # Models without JSON mode often wrap their answer in ```json ... ```
+    text = text.strip()
+    match = _FENCE_RE.match(text)
+    text = match.group(1) if match else text
+    return orjson.loads(text) if orjson is not None else json.loads(text)
+
+
+def _normalize_task(task_description: str) -> str:
+    """Canonical form of a subtask used to detect duplicates within a plan."""
+    return " ".join(task_description.lower().split())
+
+
+def _parse_outputs(text: str, count: int) -> Optional[List[str]]:
+    """Parse a batched agent response into ``count`` outputs, or ``None`` if malformed."""
+    try:
+        outputs = _loads_json(text)["outputs"]
+    except Exception:
+        return None
+    if not isinstance(outputs, list) or len(outputs) != count:
+        return None
+    return [str(output).strip() for output in outputs]
 
 
 class Orchestrator:
@@ -35,100 +109,70 @@ class Orchestrator:
 
     An orchestrator receives a goal, plans the tasks required to achieve that
     goal and delegates those tasks to appropriate worker agents. The planning
-    and delegation logic leverages the OpenAI ChatCompletion API. A
+    and delegation logic leverages the OpenAI Chat Completions API, and the
+    delegated subtasks are executed concurrently. A
     configuration of agents must be provided when constructing the orchestrator.
     """
 
-    def __init__(self, agents: List[BaseAgent], *, model: str = "gpt-4") -> None:
+    def __init__(
+        self,
+        agents: List[BaseAgent],
+        *,
+        planning_model: str = "gpt-4o-mini",
+        model: Optional[str] = None,
+        plan_cache: Optional[PlanCache] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+    ) -> None:
         """Initialise the orchestrator.
 
         Args:
             agents: A list of agent instances available for delegation. Each
                 agent should have a unique name.
-            model: The OpenAI model used for planning (default: "gpt-4").
+            planning_model: The OpenAI model used for planning (default:
+                "gpt-4o-mini"). Planning is a small structured-output task, so
+                a cheaper, faster model than the agents' is usually enough;
+                each agent keeps its own ``model`` for the actual work.
+                Models that predate JSON mode, such as "gpt-4", are prompted
+                for JSON without it and their response is parsed leniently.
+            model: Former name of ``planning_model``; overrides it when given.
+            plan_cache: Optional cache of previous plans, reused for similar goals.
+            rate_limiter: Optional limiter applied to every planning and agent
+                request, keeping concurrent calls within RPM/TPM limits.
         """
         # Map agents by lowercase name for case-insensitive lookup
         self.agents: Dict[str, BaseAgent] = {agent.name.lower(): agent for agent in agents}
-        self.model: str = model
-
-    def _ensure_openai(self, api_key: Optional[str]) -> None:
-        """Ensure the OpenAI client is available and API key is configured."""
-        if openai is None:
-            raise RuntimeError(
-                "The openai package is not installed. Install it with `pip install openai`."
-            )
-        key = api_key or os.getenv("OPENAI_API_KEY")
-        if not key:
-            raise RuntimeError(
-                "No OpenAI API key provided for the orchestrator. Set the OPENAI_API_KEY environment variable or pass api_key."
-            )
-        openai.api_key = key
-
-    def _plan(self, goal: str, *, api_key: Optional[str], temperature: float = 0.3) -> List[Tuple[str, str]]:
-        """Generate a plan by decomposing the goal into subtasks.
-
-        The OpenAI model is prompted to produce a JSON list where each element
-        contains ``agent`` and ``task`` keys. The orchestrator then parses
-        this JSON and returns a list of (agent_name, subtask_description)
-        tuples.
-
-        Args:
-            goal: The high‑level objective to accomplish.
-            api_key: Explicit OpenAI API key. If not provided, uses the
-                ``OPENAI_API_KEY`` environment variable.
-            temperature: Sampling temperature for the planning model.
-
-        Returns:
-            A list of (agent_name, subtask_description) tuples.
-
-        Raises:
-            RuntimeError: If planning fails or the response cannot be parsed.
-        """
-        self._ensure_openai(api_key)
-        # Build the description of available agents for the prompt
-        available_agents_desc = "\n".join(
-            f"- {agent.name}: {agent.role_prompt.split('.')[0]}..." for agent in self.agents.values()
+        self.planning_model: str = model or planning_model
+        self.plan_cache = plan_cache
+        self.rate_limiter = rate_limiter
+        # The planner's system message and agent list do not depend on the
+        # goal, so they are built once rather than on every planning call.
+        self._planner_system_msg = {"role": "system", "content": _PLANNER_INSTRUCTIONS}
+        self._agents_description = "\n".join(
+            f"- {agent.name}: {agent.short_description}" for agent in self.agents.values()
         )
-        system_message = {
-            "role": "system",
-            "content": (
-                "You are a Task Orchestrator Agent. Your job is to break complex goals into "
-                "manageable subtasks and assign them to appropriate specialized agents. "
-                "Return your plan as a JSON array. Each entry must have two keys: "
-                "'agent' (the name of the agent to perform the task) and 'task' (a short description of the subtask)."
-            ),
-        }
+
+    def plan_messages(self, goal: str) -> List[dict]:
+        """Build the chat messages that ask the planning model to decompose ``goal``."""
         user_message = {
             "role": "user",
             "content": (
                 f"Goal: {goal}\n\n"
-                f"Available agents:\n{available_agents_desc}\n\n"
+                f"Available agents:\n{self._agents_description}\n\n"
                 "Please propose a decomposition of the goal into subtasks. "
                 "Use only the provided agent names when assigning tasks. Format your response as JSON."
             ),
         }
+        return [self._planner_system_msg, user_message]
+
+    def parse_plan(self, plan_text: str) -> List[Tuple[str, str]]:
+        """Parse the planning model's JSON response into (agent_name, task) tuples.
+
+        Raises:
+            RuntimeError: If the response cannot be parsed.
+        """
         try:
-            response = openai.ChatCompletion.create(
-                model=self.model,
-                messages=[system_message, user_message],
-                temperature=temperature,
-            )
-        except Exception as exc:
-            raise RuntimeError(f"Orchestrator planning failed: {exc}") from exc
-        try:
-            plan_text: str = response["choices"][0]["message"]["content"].strip()
-            # Ensure JSON is enclosed properly; if not, try to extract from code block
-            plan_json_text = plan_text
-            # Remove Markdown code fences if present
-            if plan_json_text.startswith("```"):
-                # Remove the first line and last line that contain code fencing
-                parts = plan_json_text.split("\n")
-                if parts[0].startswith("```"):
-                    parts = parts[1:]
-                if parts and parts[-1].startswith("```"):
-                    parts = parts[:-1]
-                plan_json_text = "\n".join(parts)
-            plan: List[dict] = json.loads(plan_json_text)
+            parsed = _loads_json(plan_text)
+            plan: List[dict] = parsed["plan"] if isinstance(parsed, dict) else parsed
             result: List[Tuple[str, str]] = []
             for item in plan:
                 agent_name = str(item.get("agent", "")).strip()
@@ -141,26 +185,92 @@ class Orchestrator:
                 f"Failed to parse orchestration plan as JSON: {exc}. Raw response: {plan_text}"
             ) from exc
 
-    def run(self, goal: str, *, api_key: Optional[str] = None) -> Dict[str, str]:
-        """Execute a full orchestration loop for the given goal.
+    async def _request_plan(
+        self, client, model: str, messages: List[dict], temperature: float
+    ) -> List[Tuple[str, str]]:
+        """Send a planning request and parse the returned plan."""
+        options = {"response_format": PLAN_RESPONSE_FORMAT} if supports_json_mode(model) else {}
+        try:
+            async with throttle(self.rate_limiter, messages):
+                response = await client.chat.completions.create(
+                    model=model,
+                    messages=messages,
+                    temperature=temperature,
+                    **options,
+                )
+        except Exception as exc:
+            raise RuntimeError(f"Orchestrator planning failed: {exc}") from exc
+        try:
+            plan_text = response.choices[0].message.content.strip()
+        except Exception as exc:
+            raise RuntimeError(f"Unexpected response format from OpenAI API in planning: {exc}") from exc
+        return self.parse_plan(plan_text)
 
-        This method plans the goal, delegates subtasks to the configured
-        worker agents and aggregates their outputs. The final output is a
-        dictionary mapping agent names to their respective results.
+    async def _plan(self, goal: str, *, api_key: Optional[str], temperature: float = 0.3) -> List[Tuple[str, str]]:
+        """Generate a plan by decomposing the goal into subtasks.
+
+        The planning model is prompted, in JSON mode where it supports it, to
+        produce a JSON object whose ``plan`` list contains elements with ``agent`` and ``task`` keys. The orchestrator then parses
+        this JSON and returns a list of (agent_name, subtask_description)
+        tuples.
+
+        When a :class:`~task_orchestrating_agent.cache.PlanCache` is
+        configured, the goal is first embedded and compared with previously
+        planned goals. On a hit the cached plan is reused, either verbatim or
+        adapted to the new goal by the cache's (cheaper) adaptation model,
+        instead of running the full planning request.
 
         Args:
             goal: The high‑level objective to accomplish.
-            api_key: Explicit OpenAI API key. If omitted, the ``OPENAI_API_KEY``
-                environment variable is used.
+            api_key: Explicit OpenAI API key. If not provided, uses the
+                ``OPENAI_API_KEY`` environment variable.
+            temperature: Sampling temperature for the planning model.
 
         Returns:
-            A dictionary where keys are agent names and values are their outputs.
+            A list of (agent_name, subtask_description) tuples.
 
         Raises:
-            RuntimeError: If planning or agent execution fails.
+            RuntimeError: If planning fails or the response cannot be parsed.
+        """
+        client = _get_async_client(api_key)
+        plan_cache = self.plan_cache
+        embedding = None
+        if plan_cache is not None:
+            scope = plan_cache.scope(self._agents_description)
+            hit = plan_cache.get(scope, goal)
+            if hit is None:
+                try:
+                    embedding = await plan_cache.aembed(client, goal)
+                except Exception:
+                    # The plan cache is only an optimisation; plan from scratch
+                    pass
+                else:
+                    hit = plan_cache.get(scope, goal, embedding=embedding)
+            if hit is not None:
+                cached_goal, template = hit
+                if not plan_cache.adapt or cached_goal == goal:
+                    return template
+                return await self._request_plan(
+                    client,
+                    plan_cache.adapt_model,
+                    plan_cache.adaptation_messages(cached_goal, template, goal),
+                    temperature,
+                )
+        result = await self._request_plan(client, self.planning_model, self.plan_messages(goal), temperature)
+        if plan_cache is not None and embedding is not None and result:
+            plan_cache.add(scope, goal, result, embedding)
+        return result
+
+    def assign(self, goal: str, plan: List[Tuple[str, str]]) -> List[Tuple[BaseAgent, str]]:
+        """Resolve the agents of a plan and compose their prompts.
+
+        Returns:
+            A list of (agent, agent_prompt) tuples in plan order.
+
+        Raises:
+            RuntimeError: If the plan names an unknown agent.
         """
-        plan = self._plan(goal, api_key=api_key)
-        results: Dict[str, str] = {}
+        assignments: List[Tuple[BaseAgent, str]] = []
         for agent_name, task_description in plan:
             # Normalize name to lower case for lookup
             name_key = agent_name.lower()
@@ -174,5 +284,220 @@ class Orchestrator:
                 f"Subtask: {task_description}\n\n"
                 f"Context: The overall goal is '{goal}'. Perform your role on this specific subtask."
             )
-            results[agent.name] = agent.run(agent_prompt, api_key=api_key)
-        return results
\ No newline at end of file
+            assignments.append((agent, agent_prompt))
+        return assignments
+
+    def unique_subtasks(
+        self, plan: List[Tuple[str, str]], assignments: List[Tuple[BaseAgent, str]]
+    ) -> Dict[str, Tuple[BaseAgent, str, str]]:
+        """Select the subtasks of a plan that need to be executed.
+
+        Identical subtasks (ignoring case and whitespace) are executed once,
+        by the first agent they were assigned to.
+
+        Args:
+            plan: (agent_name, task_description) tuples as returned by planning.
+            assignments: The plan's (agent, agent_prompt) tuples from :meth:`assign`.
+
+        Returns:
+            A dictionary mapping each normalised subtask, in plan order, to an
+            (agent, task_description, agent_prompt) tuple.
+        """
+        unique: Dict[str, Tuple[BaseAgent, str, str]] = {}
+        for (_, task_description), (agent, prompt) in zip(plan, assignments):
+            unique.setdefault(_normalize_task(task_description), (agent, task_description, prompt))
+        return unique
+
+    def join_outputs(
+        self,
+        plan: List[Tuple[str, str]],
+        assignments: List[Tuple[BaseAgent, str]],
+        outputs_by_task: Dict[str, str],
+    ) -> Dict[str, str]:
+        """Aggregate subtask outputs into the ``{agent_name: output}`` result.
+
+        The output of a shared subtask goes to every agent it was assigned
+        to, and an agent with several subtasks gets their outputs joined by
+        blank lines, in plan order.
+
+        Args:
+            plan: (agent_name, task_description) tuples as returned by planning.
+            assignments: The plan's (agent, agent_prompt) tuples from :meth:`assign`.
+            outputs_by_task: Output of each subtask, keyed as in :meth:`unique_subtasks`.
+        """
+        agent_outputs: Dict[str, List[str]] = defaultdict(list)
+        agent_tasks: Dict[str, set] = defaultdict(set)
+        for (_, task_description), (agent, _) in zip(plan, assignments):
+            task_key = _normalize_task(task_description)
+            if task_key not in agent_tasks[agent.name]:
+                agent_tasks[agent.name].add(task_key)
+                agent_outputs[agent.name].append(outputs_by_task[task_key])
+        return {agent_name: "\n\n".join(texts) for agent_name, texts in agent_outputs.items()}
+
+    def _batched_prompt(self, goal: str, task_descriptions: List[str]) -> str:
+        """Compose one prompt asking an agent to perform several subtasks."""
+        count = len(task_descriptions)
+        numbered = "\n".join(f"{index}. {task}" for index, task in enumerate(task_descriptions, 1))
+        return (
+            f"You have {count} subtasks:\n{numbered}\n\n"
+            f"Context: The overall goal is '{goal}'. Perform your role on each subtask separately.\n\n"
+            f"Respond with a JSON object with a single key 'outputs' holding an array of exactly {count} "
+            "strings, where the i-th string is your complete result for subtask i."
+        )
+
+    async def _run_agent_tasks(
+        self,
+        goal: str,
+        agent: BaseAgent,
+        tasks: List[Tuple[str, str]],
+        *,
+        api_key: Optional[str],
+        temperature: float,
+        on_chunk: Optional[Callable[[str, str], None]],
+    ) -> List[str]:
+        """Run all of one agent's subtasks, in a single request when there are several.
+
+        Args:
+            goal: The high‑level objective the subtasks belong to.
+            agent: The agent performing the subtasks.
+            tasks: (task_description, agent_prompt) tuples for the agent.
+            api_key: Explicit OpenAI API key.
+            temperature: Sampling temperature for the agent.
+            on_chunk: Optional streaming callback, see :meth:`run_async`.
+
+        Returns:
+            The agent's outputs, in the order of ``tasks``.
+        """
+        options = {"api_key": api_key, "temperature": temperature, "rate_limiter": self.rate_limiter}
+        if len(tasks) == 1:
+            chunk_callback = functools.partial(on_chunk, agent.name) if on_chunk is not None else None
+            return [await agent.run_async(tasks[0][1], on_chunk=chunk_callback, **options)]
+        # Several subtasks share one request, so the role prompt and the
+        # per-request overhead are paid once. The batched response is JSON
+        # and is therefore not streamed; each output is reported once parsed.
+        prompt = self._batched_prompt(goal, [task_description for task_description, _ in tasks])
+        batched_options = {"response_format": BATCHED_RESPONSE_FORMAT} if supports_json_mode(agent.model) else {}
+        try:
+            text = await agent.run_async(prompt, **batched_options, **options)
+        except RuntimeError:
+            outputs = None
+        else:
+            outputs = _parse_outputs(text, len(tasks))
+        if outputs is not None:
+            if on_chunk is not None:
+                for index, output in enumerate(outputs, 1):
+                    on_chunk(f"{agent.name} #{index}", output)
+            return outputs
+        # The batched request failed or did not return one output per
+        # subtask; run the subtasks individually.
+        return list(
+            await asyncio.gather(
+                *(
+                    agent.run_async(
+                        prompt,
+                        on_chunk=functools.partial(on_chunk, f"{agent.name} #{index}") if on_chunk is not None else None,
+                        **options,
+                    )
+                    for index, (_, prompt) in enumerate(tasks, 1)
+                )
+            )
+        )
+
+    async def run_async(
+        self,
+        goal: str,
+        *,
+        api_key: Optional[str] = None,
+        temperature: float = 0.7,
+        on_chunk: Optional[Callable[[str, str], None]] = None,
+    ) -> Dict[str, str]:
+        """Execute a full orchestration loop for the given goal.
+
+        This method plans the goal, delegates subtasks to the configured
+        worker agents and aggregates their outputs. The subtasks of a plan are
+        independent of each other, so all agent calls are dispatched at once
+        and awaited together; the wall time of the delegation step is roughly
+        that of the slowest agent rather than the sum of all of them. A
+        subtask that the plan assigns to several agents is only executed
+        once, and all subtasks assigned to the same agent are sent in a
+        single request. The final output is a dictionary mapping agent names
+        to their respective results; an agent with several subtasks gets
+        their outputs joined by blank lines, in plan order.
+
+        Args:
+            goal: The high‑level objective to accomplish.
+            api_key: Explicit OpenAI API key. If omitted, the ``OPENAI_API_KEY``
+                environment variable is used.
+            temperature: Sampling temperature for the worker agents.
+            on_chunk: Optional callback invoked with ``(agent_name, text)``
+                for each piece of agent output as it is streamed. When an
+                agent runs several subtasks, their streams are told apart by
+                a ``#n`` suffix on the name.
+
+        Returns:
+            A dictionary where keys are agent names and values are their outputs.
+
+        Raises:
+            RuntimeError: If planning or agent execution fails.
+        """
+        plan = await self._plan(goal, api_key=api_key)
+        assignments = self.assign(goal, plan)
+        # The distinct subtasks are grouped per agent so each agent is called once
+        groups: Dict[str, Dict[str, Tuple[str, str]]] = defaultdict(dict)
+        group_agents: Dict[str, BaseAgent] = {}
+        for task_key, (agent, task_description, prompt) in self.unique_subtasks(plan, assignments).items():
+            groups[agent.name][task_key] = (task_description, prompt)
+            group_agents[agent.name] = agent
+        outputs = await asyncio.gather(
+            *(
+                self._run_agent_tasks(
+                    goal,
+                    group_agents[agent_name],
+                    list(tasks.values()),
+                    api_key=api_key,
+                    temperature=temperature,
+                    on_chunk=on_chunk,
+                )
+                for agent_name, tasks in groups.items()
+            ),
+            return_exceptions=True,
+        )
+        outputs_by_task: Dict[str, str] = {}
+        for tasks, group_outputs in zip(groups.values(), outputs):
+            if isinstance(group_outputs, BaseException):
+                raise group_outputs
+            outputs_by_task.update(zip(tasks, group_outputs))
+        return self.join_outputs(plan, assignments, outputs_by_task)
+
+    def run(
+        self,
+        goal: str,
+        *,
+        api_key: Optional[str] = None,
+        temperature: float = 0.7,
+        on_chunk: Optional[Callable[[str, str], None]] = None,
+    ) -> Dict[str, str]:
+        """Synchronous wrapper around :meth:`run_async`.
+
+        Args:
+            goal: The high‑level objective to accomplish.
+            api_key: Explicit OpenAI API key. If omitted, the ``OPENAI_API_KEY``
+                environment variable is used.
+            temperature: Sampling temperature for the worker agents.
+            on_chunk: Optional callback invoked with ``(agent_name, text)``
+                for each piece of agent output as it is streamed.
+
+        Returns:
+            A dictionary where keys are agent names and values are their outputs.
+
+        Raises:
+            RuntimeError: If planning or agent execution fails.
+        """
+
+        async def _run() -> Dict[str, str]:
+            try:
+                return await self.run_async(goal, api_key=api_key, temperature=temperature, on_chunk=on_chunk)
+            finally:
+                await aclose_async_clients()
+
+        return asyncio.run(_run())
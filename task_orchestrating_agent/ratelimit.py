@@ -0,0 +1,162 @@
+"""Client-side rate limiting for concurrent OpenAI requests.
+
+:class:`RateLimiter` throttles requests so that a burst of concurrent agent
+calls stays within the account's requests-per-minute (RPM) and
+tokens-per-minute (TPM) limits instead of running into HTTP 429 responses.
+It follows the token-bucket scheme of the OpenAI cookbook's
+``api_request_parallel_processor.py``: request and token capacity refill
+continuously at the configured per-minute rate, and a request waits until
+enough of both is available. An optional cap on the number of requests in
+flight is enforced with a semaphore.
+
+Example usage::
+
+    from task_orchestrating_agent.agents import get_default_agents
+    from task_orchestrating_agent.orchestrator import Orchestrator
+    from task_orchestrating_agent.ratelimit import RateLimiter
+    limiter = RateLimiter(max_requests_per_minute=500, max_tokens_per_minute=30_000)
+    orchestrator = Orchestrator(get_default_agents(), rate_limiter=limiter)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncContextManager, AsyncIterator, List, Optional
+
+#: Rough number of characters per token used to estimate prompt size.
+CHARS_PER_TOKEN = 4
+#: Tokens of overhead the chat format adds per message.
+TOKENS_PER_MESSAGE = 4
+
+
+def estimate_tokens(messages: List[dict], completion_tokens: int) -> int:
+    """Estimate the tokens a chat request counts against the TPM limit.
+
+    Args:
+        messages: Chat messages of the request.
+        completion_tokens: Expected number of tokens in the response.
+
+    Returns:
+        The estimated prompt plus completion tokens.
+    """
+    prompt_tokens = sum(
+        TOKENS_PER_MESSAGE + len(str(message.get("content", ""))) // CHARS_PER_TOKEN for message in messages
+    )
+    return prompt_tokens + completion_tokens
+
+
+class RateLimiter:
+    """Token-bucket limiter for requests and tokens per minute."""
+
+    def __init__(
+        self,
+        *,
+        max_requests_per_minute: Optional[float] = None,
+        max_tokens_per_minute: Optional[float] = None,
+        max_concurrency: Optional[int] = None,
+        completion_tokens: int = 1024,
+    ) -> None:
+        """Initialise the limiter.
+
+        Args:
+            max_requests_per_minute: Request budget per minute, or ``None``
+                for no request limit.
+            max_tokens_per_minute: Token budget per minute, or ``None`` for no
+                token limit.
+            max_concurrency: Maximum number of requests in flight, or
+                ``None`` for no limit.
+            completion_tokens: Expected response length used when estimating
+                the tokens of a request.
+        """
+        self.max_requests_per_minute = max_requests_per_minute
+        self.max_tokens_per_minute = max_tokens_per_minute
+        self.max_concurrency = max_concurrency
+        self.completion_tokens = completion_tokens
+        self._available_requests = max_requests_per_minute or 0.0
+        self._available_tokens = max_tokens_per_minute or 0.0
+        self._last_update = time.monotonic()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock: Optional[asyncio.Lock] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    def _bind(self) -> None:
+        # asyncio primitives must belong to the loop they are used from.
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop:
+            self._loop = loop
+            self._lock = asyncio.Lock()
+            self._semaphore = asyncio.Semaphore(self.max_concurrency) if self.max_concurrency else None
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._last_update
+        self._last_update = now
+        if self.max_requests_per_minute:
+            self._available_requests = min(
+                self.max_requests_per_minute,
+                self._available_requests + self.max_requests_per_minute * elapsed / 60.0,
+            )
+        if self.max_tokens_per_minute:
+            self._available_tokens = min(
+                self.max_tokens_per_minute,
+                self._available_tokens + self.max_tokens_per_minute * elapsed / 60.0,
+            )
+
+    def _wait_time(self, tokens: float) -> float:
+        """Seconds until one request of ``tokens`` fits in both buckets."""
+        wait = 0.0
+        if self.max_requests_per_minute and self._available_requests < 1:
+            wait = max(wait, (1 - self._available_requests) * 60.0 / self.max_requests_per_minute)
+        if self.max_tokens_per_minute and self._available_tokens < tokens:
+            wait = max(wait, (tokens - self._available_tokens) * 60.0 / self.max_tokens_per_minute)
+        return wait
+
+    async def acquire(self, tokens: int) -> None:
+        """Wait until capacity for one request of ``tokens`` is available and consume it."""
+        self._bind()
+        if self.max_tokens_per_minute:
+            # A request larger than the whole bucket would otherwise wait forever.
+            tokens = min(tokens, self.max_tokens_per_minute)
+        async with self._lock:
+            while True:
+                self._refill()
+                wait = self._wait_time(tokens)
+                if wait <= 0:
+                    break
+                await asyncio.sleep(wait)
+            if self.max_requests_per_minute:
+                self._available_requests -= 1
+            if self.max_tokens_per_minute:
+                self._available_tokens -= tokens
+
+    @asynccontextmanager
+    async def limit(self, messages: List[dict]) -> AsyncIterator[None]:
+        """Hold a concurrency slot and rate capacity for one chat request.
+
+        Args:
+            messages: Chat messages of the request, used to estimate its tokens.
+        """
+        self._bind()
+        semaphore = self._semaphore
+        if semaphore is not None:
+            await semaphore.acquire()
+        try:
+            await self.acquire(estimate_tokens(messages, self.completion_tokens))
+            yield
+        finally:
+            if semaphore is not None:
+                semaphore.release()
+
+
+@asynccontextmanager
+async def _unlimited() -> AsyncIterator[None]:
+    yield
+
+
+def throttle(rate_limiter: Optional[RateLimiter], messages: List[dict]) -> AsyncContextManager[None]:
+    """Return ``rate_limiter.limit(messages)``, or a no-op context without a limiter."""
+    if rate_limiter is None:
+        return _unlimited()
+    return rate_limiter.limit(messages)